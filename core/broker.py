@@ -58,7 +58,8 @@ class Broker:
         symbol = event.symbol
         current_time = event.timestamp
         if not self.market_calendar.is_market_open(current_time,symbol):
-            self.logger.info(f"OrderEvent: Market closed. Delaying order: {event} at {current_time}")
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"OrderEvent: Market closed. Delaying order: {event} at {current_time}")
             self.pending_orders.put(event)
         else:
             fill_event = self._fill_order(event, current_time)
@@ -78,7 +79,8 @@ class Broker:
                     self.event_queue.put(fill_event)
             else:
                 requeue.append(order_event)
-                self.logger.info(f"MarketEvent: Market closed. Delaying order: {order_event} at {current_time}")
+                if self.logger.isEnabledFor(logging.INFO):
+                    self.logger.info(f"MarketEvent: Market closed. Delaying order: {order_event} at {current_time}")
         for order_event in requeue:
             self.pending_orders.put(order_event)
 
@@ -105,13 +107,16 @@ class Broker:
             self.logger.warning(f"No price found for symbol: {symbol} {price} {type(price)}")
             return None
 
+        # Fees are proportional to the traded notional, compute it once per fill
+        notional = quantity * price
+
         # Apply slippage
         # For now, slippage is not included in the fill_price but treated as a separate fee
-        slippage = self.slippage_perc * quantity * price
+        slippage = self.slippage_perc * notional
         fill_price = price # + slippage if direction == 'BUY' else price - slippage
 
         # Commission
-        commission = self.commission_perc * quantity * fill_price
+        commission = self.commission_perc * notional
 
         fill_event = FillEvent(
             timestamp=timestamp,
@@ -1,6 +1,6 @@
 # engine.py
 
-from queue import LifoQueue
+from collections import deque
 from datetime import datetime, timezone
 from core.event import Event, MarketEvent, OrderEvent, SignalEvent, FillEvent
 from core.metrics import DataCollector
@@ -30,17 +30,27 @@ class BacktestEngine:
         self.logger.info("Starting backtest...")
         self.start_time = datetime.now(timezone.utc)
 
+        # Bind the per-event lookups once, instead of resolving them for every event
+        is_empty = self.event_queue.is_empty
+        get_events = self.event_queue.get_with_market_events_aggregated
+        handlers = self._event_handlers()
+        on_step = self.on_step
+        if on_step:
+            record_portfolio_snapshot = self.portfolio._record_portfolio_snapshot
+            event_snapshot = self.data_collector.event_snapshot
+
         try:
-            while not self.event_queue.is_empty():
+            while not is_empty():
                 # 2. Process event in the queue
-                event_list = self.event_queue.get_with_market_events_aggregated()
+                event_list = get_events()
                 for event in event_list:
-                    self.broadcast(event)
-                    if self.on_step:
-                        portfolio_snapshot = self.portfolio._record_portfolio_snapshot()
-                        event_snapshot = event.snapshot()
-                        merged = portfolio_snapshot | event_snapshot
-                        self.data_collector.event_snapshot(merged)
+                    # Broadcast the event to every module, in the order of _event_handlers()
+                    self.current_time = event.timestamp
+                    for handle_event in handlers:
+                        handle_event(event)
+                    if on_step:
+                        merged = record_portfolio_snapshot() | event.snapshot()
+                        event_snapshot(merged)
 
         except Exception as e:
             self.logger.error(f"Backtest failed at {self.current_time}: {e}", exc_info=True)
@@ -50,37 +60,41 @@ class BacktestEngine:
             self.end_time = datetime.now(timezone.utc)
             self.logger.info(f"Backtest completed in {(self.end_time - self.start_time).total_seconds():.4f}s")
 
-    def broadcast(self, event: Event) -> None:
-        self.current_time = event.timestamp
-        self.market_context.handle_event(event)
-        self.broker.handle_event(event)
-        self.portfolio.handle_event(event)
-        self.strategy.handle_event(event)
+    def _event_handlers(self) -> tuple:
+        '''Event handlers of the modules, in the order they receive each event.'''
+        return (self.market_context.handle_event,
+                self.broker.handle_event,
+                self.portfolio.handle_event,
+                self.strategy.handle_event)
 
 
 class EventQueue:
     def __init__(self,logger=None):
         self.logger = logger or logging.getLogger(__name__)    
-        self._queue = LifoQueue()
+        # Last in, first out. The engine is single threaded, so a plain deque is used instead of a locked queue.
+        self._queue = deque()
 
     def put(self, event):
         """Add an event to the queue."""
-        self._queue.put(event)
+        self._queue.append(event)
+
+    def put_many(self, events):
+        """Add several events to the queue in one call."""
+        self._queue.extend(events)
 
     def get(self):
         """Remove and return the next event from the queue.
         Returns None if the queue is empty."""
         try:
-            event = self._queue.get()
-            return event
-        except self._queue.Empty:
+            return self._queue.pop()
+        except IndexError:
             return None
 
     def get_with_market_events_aggregated(self):
         if self.is_empty():
             return []
         
-        event = self._queue.get()
+        event = self._queue.pop()
         if event.type != 'MARKET':
             return [event]
         
@@ -88,19 +102,26 @@ class EventQueue:
         event_list = [event]
         timestamp = event.timestamp
         while not self.is_empty():
-            next_event = self._queue.get()
+            next_event = self._queue.pop()
             if event.type == 'MARKET' and next_event.timestamp == timestamp:
                 event_list.append(next_event)
             else:
-                self._queue.put(next_event)
+                self._queue.append(next_event)
                 break
 
         return event_list
 
     def is_empty(self):
         """Return True if the queue is empty, False otherwise."""
-        return self._queue.empty()
+        return not self._queue
+
+    # queue.Queue spelling, for callers written against the standard library queue
+    empty = is_empty
+
+    def clear(self):
+        """Remove all events from the queue."""
+        self._queue.clear()
 
     def size(self):
         """Return the current size of the queue."""
-        return self._queue.qsize()
+        return len(self._queue)
@@ -1,8 +1,6 @@
 import pandas as pd
 import yfinance as yf
 import os
-import sys
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from datetime import datetime, timedelta
 import logging
 from core.event import MarketEvent
@@ -56,15 +54,20 @@ class Csvio:
     def __init__(self, logger=None):
         self.logger = logger or logging.getLogger(__name__)
 
-    def read_csv(self, filename: str) -> pd.DataFrame | None:
-        '''read file to CSV with optional logging'''
+    def read_csv(self, filename: str, dtype: dict | None = None) -> pd.DataFrame | None:
+        '''
+        read file to CSV with optional logging
+        dtype: optional column->dtype mapping, so the C parser skips type inference
+        '''
         try:
             if not os.path.exists(filename):
                 self.logger.error(f"File '{filename}' does not exist.")
                 return None
             
-            df = pd.read_csv(filename, parse_dates=['Date'])
-            df = df.set_index('Date')
+            # Index is built by the parser, set_index would copy every column once more.
+            # The file is memory mapped, so repeated reads are served from the page cache without a buffered copy.
+            df = pd.read_csv(filename, index_col='Date', parse_dates=['Date'], dtype=dtype, engine='c',
+                             memory_map=True)
             return df
         except Exception as e:
             self.logger.error(f"Error reading CSV: {e}")
@@ -190,6 +193,15 @@ class DataStore:
             return None
         return self.data[symbol]
 
+    def get_timestamps_ns(self,symbol: str) -> np.ndarray | None:
+        '''
+        Interface method to get the index of a given symbol as int64 nanoseconds since epoch.
+        Numeric consumers can compare and search these without boxing datetime objects.
+        '''
+        if symbol not in self.data:
+            return None
+        return self.data[symbol].index.as_unit('ns').asi8
+
     def get_last_time(self,symbol: str) -> datetime | None:
         '''Interface method to get the final time available for a given symbol'''
         if symbol in self.data:
@@ -208,18 +220,27 @@ class YfInterface:
         """
         self.yfinance_objects = {}
 
+    def _get_ticker(self, symbol: str) -> yf.Ticker | None:
+        '''Return the cached yfinance.Ticker of symbol, creating it on first use'''
+        ticker = self.yfinance_objects.get(symbol)
+        if ticker is None:
+            try:
+                ticker = yf.Ticker(symbol)
+            except Exception as e:
+                self.logger.warning(f"Creating yfinance.Ticker failed: {e}")
+                return None
+            self.yfinance_objects[symbol] = ticker
+        return ticker
+
     def fetch_data(self, symbol: str, start_date: datetime, end_date: datetime, interval='1d') -> pd.DataFrame | None:
         '''
         Wrapper function for yf.Ticker.history calls
         Return pd.DataFrame with downloaded history
         For now, only tested to work on time interval '1d'
         '''
-        if symbol not in self.yfinance_objects:
-            try:
-                self.yfinance_objects[symbol] = yf.Ticker(symbol)
-            except Exception as e:
-                self.logger.warning(f"Creating yfinance.Ticker failed: {e}")
-                return None
+        ticker = self._get_ticker(symbol)
+        if ticker is None:
+            return None
 
         if isinstance(start_date,datetime):
             try:
@@ -236,7 +257,7 @@ class YfInterface:
                 return None
 
         try:
-            df = self.yfinance_objects[symbol].history(
+            df = ticker.history(
                 start=start_date,
                 end=end_date,
                 interval=interval
@@ -255,14 +276,11 @@ class YfInterface:
         Return pd.DataFrame with downloaded history
         For now, only tested to work on time interval '1d'
         '''
-        if symbol not in self.yfinance_objects:
-            try:
-                self.yfinance_objects[symbol] = yf.Ticker(symbol)
-            except Exception as e:
-                self.logger.warning(f"Creating yfinance.Ticker failed: {e}")
-                return None
+        ticker = self._get_ticker(symbol)
+        if ticker is None:
+            return None
         try:
-            df = self.yfinance_objects[symbol].history(
+            df = ticker.history(
                 period='max',
                 interval=interval
             )
@@ -290,8 +308,14 @@ class DataHandler:
         self.csvio = Csvio(logger=self.logger)
         self.yfinterface = YfInterface(logger=self.logger)
 
-    def read_csv(self, symbol: str, filename: str, log=True) -> None:
-        df = self.csvio.read_csv(filename)
+    def read_csv(self, symbol: str, filename: str, log=True, dtype: dict | None = None) -> None:
+        '''
+        Read OHLCV data for symbol from CSV into the DataStore.
+        Columns are parsed with the DataStore dtypes unless dtype overrides them.
+        '''
+        if dtype is None:
+            dtype = {col: dt for col, dt in self.datastore.ohlcv_column_dtypes.items() if col != 'Date'}
+        df = self.csvio.read_csv(filename, dtype=dtype)
         
         if df is None:
             self.logger.info(f'No data to write to CSV: {symbol}')
@@ -349,35 +373,31 @@ class DataHandler:
         else:
             self.datastore.append_data(symbol,df)
     
-    def create_market_event(self,index: datetime, next_item: pd.Series) -> MarketEvent:
-        event = MarketEvent(
-        timestamp = index,
-        symbol = next_item['Symbol'],
-        open = next_item['Open'],
-        high = next_item['High'],
-        low = next_item['Low'],
-        close = next_item ['Close'],
-        volume = next_item['Volume'])
-        return event
-
     def create_event_queue_lazy(self) -> None:
         symbols = self.datastore.get_symbol_list()
-        eventqueue_dataframe = self.datastore._create_empty_OHLCV_frame()
+        frames = []
         for symbol in symbols:
             df = self.datastore.get_all_symbol_data(symbol)
             typecheck = self.validator.ohlcv_validate(df)
             if not typecheck:
                 return None
-            if eventqueue_dataframe.empty:
-                eventqueue_dataframe = df
-            else:
-                eventqueue_dataframe = pd.concat([eventqueue_dataframe,df])
-        
+            frames.append(df)
+
+        # One concat over all symbols instead of re-copying the accumulated frame per symbol
+        if frames:
+            eventqueue_dataframe = pd.concat(frames)
+        else:
+            eventqueue_dataframe = self.datastore._create_empty_OHLCV_frame()
         eventqueue_dataframe = eventqueue_dataframe.sort_index(ascending=False)
         assert eventqueue_dataframe.index.is_monotonic_decreasing
-        for index, row in eventqueue_dataframe.iterrows():
-            event = self.create_market_event(index,row)
-            self.eventqueue.put(event)
+        # Build events straight from the columns, without a pd.Series per row.
+        # tolist() hands out native Python floats, which are cheaper in the per-event arithmetic than numpy scalars.
+        columns = [eventqueue_dataframe[column].tolist()
+                   for column in ('Symbol','Open','High','Low','Close','Volume')]
+        events = [MarketEvent(index, symbol, open, high, low, close, volume)
+                  for index, symbol, open, high, low, close, volume
+                  in zip(eventqueue_dataframe.index.tolist(), *columns)]
+        self.eventqueue.put_many(events)
 
     def clear_symbol_data(self,symbol: str) -> None:
         self.datastore.clear_symbol_data(symbol)
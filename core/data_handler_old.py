@@ -223,6 +223,8 @@ class DataStore:
 
     def create_data_for_eventqueue(self):
         self.logger.debug(f"Symbols in data: {list(self.data.keys())}")
+        # Collect per-symbol frames and concatenate once, instead of growing the frame symbol by symbol
+        frames = [] if self.data_for_market_event.empty else [self.data_for_market_event]
         for symbol, data in self.data.items():
             # Only proceed if data format is correct (invert your logic)
             if not self._check_OHLCV_format(symbol):
@@ -232,23 +234,18 @@ class DataStore:
                 self.logger.info('Data format checking passed')
             
             #Important limitation!!!! Later need to be revised if more info is needed
-            columns_to_copy = ['Open','High','Low','Close','Volume']
-            copy_data = data.copy(columns_to_copy)
-            
-            # Add required columns for data_for_market_event
-            copy_data['Symbol'] = symbol
-            copy_data['MarketEvent'] = 0.0
+            # Add required columns for data_for_market_event, assign returns a new frame
+            copy_data = data.assign(Symbol=symbol, MarketEvent=0.0)
             
             # Make sure index name is 'Date' for consistency
             if copy_data.index.name != 'Date':
                 copy_data = copy_data.set_index('Date')
             
-            # Append to existing DataFrame
-            if self.data_for_market_event.empty and not copy_data.empty :
-                self.data_for_market_event = copy_data
-            else:
-                self.data_for_market_event = pd.concat([self.data_for_market_event, copy_data])
+            if not copy_data.empty:
+                frames.append(copy_data)
         
+        if frames:
+            self.data_for_market_event = pd.concat(frames)
         # Sort by index (Date) ascending
         self.data_for_market_event = self.data_for_market_event.sort_index()
 
@@ -0,0 +1,47 @@
+import numpy as np
+
+def run_fixed_price(opens, closes, buy_price: float, sell_price: float, quantity: float, cash: float,
+                    commission_perc: float = 0.0, slippage_perc: float = 0.0):
+    '''
+    Event-free replay of FixedPriceStrategy with a FIXED risk model on a single symbol.
+    Mirrors the engine: the signal is decided on the open, the order is filled at the close of the same bar,
+    and commission and slippage are charged as separate fees on the traded notional.
+    Like the strategy, the state flips when a signal is emitted, not when the fill succeeds. As in Portfolio,
+    a buy the cash does not cover still enters the position unpaid, and a fill is only listed once the
+    notional and both fees are settled.
+    Param: opens, closes: per-bar price columns of equal length
+    Return: (closing cash, fills) where fills is a list of (bar index, 'BUY' | 'SELL', fill price)
+    '''
+    # Native floats iterate faster than numpy scalars in a plain Python loop
+    opens = np.asarray(opens, dtype=np.float64).tolist()
+    closes = np.asarray(closes, dtype=np.float64).tolist()
+    fills = []
+    in_position = False
+    for bar, (price, fill_price) in enumerate(zip(opens, closes)):
+        if in_position:
+            if not price >= sell_price:
+                continue
+            direction = 'SELL'
+        elif not price <= buy_price:
+            continue
+        else:
+            direction = 'BUY'
+        in_position = not in_position
+
+        notional = quantity * fill_price
+        if direction == 'BUY':
+            if not cash > notional:
+                continue
+            cash -= notional
+        else:
+            cash += notional
+        # Fees are settled one by one, each only if the cash covers it
+        settled = True
+        for fee in (commission_perc * notional, slippage_perc * notional):
+            if not cash > fee:
+                settled = False
+                break
+            cash -= fee
+        if settled:
+            fills.append((bar, direction, fill_price))
+    return cash, fills
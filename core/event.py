@@ -3,8 +3,37 @@
 from datetime import datetime
 import logging
 from abc import ABC, abstractmethod
+from enum import IntEnum
+import numpy as np
+
+class Direction(IntEnum):
+    '''
+    Trade direction as a signed integer, the sign of the position change.
+    Events keep 'BUY'/'SELL' strings; array based fill processing encodes them once with Direction.encode.
+    '''
+    BUY = 1
+    SELL = -1
+
+    @classmethod
+    def encode(cls, directions) -> np.ndarray:
+        '''Convert a sequence of 'BUY'/'SELL' strings to an int8 array, unknown directions become 0.'''
+        lookup = {'BUY': cls.BUY, 'SELL': cls.SELL}
+        return np.fromiter((lookup.get(direction, 0) for direction in directions), dtype=np.int8, count=len(directions))
 
 class Event(ABC):
+    # Events are created once per bar and per order, so they use fixed slots instead of an instance __dict__.
+    # Subclasses list their slots in assignment order, snapshot() keys follow base class slots first.
+    __slots__ = ('type',)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        fields = []
+        for klass in reversed(cls.__mro__):
+            for name in klass.__dict__.get('__slots__', ()):
+                if not name.startswith('_') and name not in fields:
+                    fields.append(name)
+        cls._snapshot_fields = tuple(fields)
+
     def __init__(self):
         self.type = 'GENERIC'
 
@@ -13,9 +42,11 @@ class Event(ABC):
         return f"{self.__class__.__name__}"
 
     def snapshot(self):
-        return {k: v for k, v in vars(self).items() if not k.startswith('_')}
+        return {k: getattr(self, k) for k in self._snapshot_fields}
 
 class MarketEvent(Event):
+    __slots__ = ('timestamp', 'symbol', 'price', 'open', 'high', 'low', 'close', 'volume')
+
     def __init__(self, timestamp, symbol, open, high=None, low=None, close=None, volume=None):
         super().__init__()
         self.type = 'MARKET'
@@ -33,6 +64,8 @@ class MarketEvent(Event):
 
 
 class SignalEvent(Event):
+    __slots__ = ('timestamp', 'symbol', 'signal_type')
+
     def __init__(self, timestamp, symbol, signal_type):
         super().__init__()
         self.type = 'SIGNAL'
@@ -45,6 +78,8 @@ class SignalEvent(Event):
 
 
 class OrderEvent(Event):
+    __slots__ = ('timestamp', 'symbol', 'order_type', 'quantity', 'direction')
+
     def __init__(self, timestamp, symbol, order_type, quantity, direction):
         super().__init__()
         self.type = 'ORDER'
@@ -60,6 +95,8 @@ class OrderEvent(Event):
 
 
 class FillEvent(Event):
+    __slots__ = ('timestamp', 'symbol', 'quantity', 'direction', 'fill_price', 'commission', 'slippage')
+
     def __init__(self, timestamp, symbol, quantity, direction, fill_price, commission=0.0, slippage=0.0):
         super().__init__()
         self.type = 'FILL'
@@ -82,6 +119,8 @@ class FillEvent(Event):
         )
 
 class FillDeclinedEvent(Event):
+    __slots__ = ('timestamp', 'symbol', 'message')
+
     def __init__(self,timestamp, symbol, message):
         self.type = 'FillDeclined'
         self.timestamp = timestamp
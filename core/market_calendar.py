@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+from datetime import datetime
+import logging
+
+class MarketCalendar:
+    '''
+    Class for answering whether a market is open for a symbol at a given time.
+    Trading sessions are kept per symbol as sorted int64 arrays of open and close times (ns since epoch),
+    so a lookup is a binary search with np.searchsorted instead of a scan over the schedule.
+    Symbols without registered sessions (e.g. crypto) are treated as always open.
+    Tz-aware times are compared in UTC. Sessions and queried times must both be tz-aware or both tz-naive,
+    the raw nanoseconds of a naive and an aware time do not refer to the same clock.
+    '''
+    def __init__(self, logger=None):
+        self.logger = logger or logging.getLogger(__name__)
+        self.sessions = {} # key: symbol, value: (opens, closes, tz_aware), opens and closes as int64 arrays
+
+    def set_sessions(self, symbol: str, opens, closes) -> bool:
+        '''
+        Register the trading sessions of a symbol. A session covers open <= time < close.
+        Param: opens, closes: sequences of datetimes with one entry per session
+        Return: True if sessions were stored
+                False if sessions are inconsistent
+        '''
+        opens = pd.DatetimeIndex(opens)
+        closes = pd.DatetimeIndex(closes)
+        tz_aware = opens.tz is not None
+        if tz_aware != (closes.tz is not None):
+            self.logger.warning(f'MarketCalendar: opens and closes mix tz-aware and tz-naive times for {symbol}')
+            return False
+        opens = opens.as_unit('ns').asi8
+        closes = closes.as_unit('ns').asi8
+        if len(opens) != len(closes):
+            self.logger.warning(f'MarketCalendar: opens and closes length differ for {symbol}')
+            return False
+        if np.any(opens >= closes):
+            self.logger.warning(f'MarketCalendar: session closes before it opens for {symbol}')
+            return False
+        if np.any(opens[1:] < closes[:-1]):
+            self.logger.warning(f'MarketCalendar: sessions are unsorted or overlapping for {symbol}')
+            return False
+        self.sessions[symbol] = (opens, closes, tz_aware)
+        return True
+
+    def is_market_open(self, timestamp: datetime, symbol: str) -> bool:
+        if symbol not in self.sessions:
+            return True
+        opens, closes, tz_aware = self.sessions[symbol]
+        timestamp = pd.Timestamp(timestamp)
+        if (timestamp.tz is not None) != tz_aware:
+            raise ValueError(f'MarketCalendar: cannot compare a tz-{"aware" if timestamp.tz else "naive"} time '
+                             f'with the tz-{"aware" if tz_aware else "naive"} sessions of {symbol}')
+        # Aware times are UTC nanoseconds, so different zones compare correctly
+        time_ns = timestamp.as_unit('ns').value
+        # Last session that opened at or before timestamp
+        i = np.searchsorted(opens, time_ns, side='right') - 1
+        return bool(i >= 0 and time_ns < closes[i])
+
+class AlwaysOpenCalendar:
+    '''
+    Market calendar for backtests where trading is never restricted, e.g. synthetic data or crypto.
+    '''
+    __slots__ = ()
+
+    def is_market_open(self, timestamp: datetime, symbol: str) -> bool:
+        return True
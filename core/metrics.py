@@ -1,5 +1,15 @@
+import pandas as pd
+
 class DataCollector:
     def __init__(self):
+        '''
+        Every log is a list of snapshot dicts, appending is the cheapest operation on the per-event path.
+        Values are stored as given, no type conversion happens before to_frame().
+        '''
+        self.clear()
+
+    def clear(self) -> None:
+        '''Drop all collected snapshots.'''
         self.portfolio_log = []
         self.position_log = []
         self.event_log = []
@@ -17,3 +27,32 @@ class DataCollector:
     def fill_snapshot(self, snapshot: dict) -> None:
         self.fill_log.append(snapshot)
 
+    def to_frame(self, which: str) -> pd.DataFrame:
+        '''
+        Materialize one of the logs as a DataFrame, once, after the run.
+        Param: which: 'portfolio_log', 'position_log', 'event_log' or 'fill_log'
+        '''
+        return pd.DataFrame(getattr(self, which))
+
+class NullDataCollector:
+    '''
+    Drop-in replacement for DataCollector that discards every snapshot.
+    Used where logs are not needed, e.g. speed measurements.
+    '''
+    def clear(self) -> None:
+        pass
+
+    def portfolio_snapshot(self, snapshot: dict) -> None:
+        pass
+
+    def position_snapshot(self, snapshot: dict) -> None:
+        pass
+
+    def event_snapshot(self, snapshot: dict) -> None:
+        pass
+
+    def fill_snapshot(self, snapshot: dict) -> None:
+        pass
+
+    def to_frame(self, which: str) -> pd.DataFrame:
+        return pd.DataFrame()
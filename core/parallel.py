@@ -0,0 +1,69 @@
+from concurrent.futures import ProcessPoolExecutor
+import logging
+from core.core import BacktestEngine, EventQueue
+from core.broker import Broker
+from core.portfolio import Portfolio
+from core.strategy import FixedPriceStrategy
+from core.data_handler import DataHandler
+from core.market_calendar import AlwaysOpenCalendar
+from core.market_context import MarketContext
+from core.metrics import DataCollector
+
+def run_instrument(symbol: str, csv_path: str, params: dict) -> dict | None:
+    '''
+    Run a FixedPriceStrategy backtest for one symbol from its OHLCV CSV file.
+    Builds its own set of components, so it can run in a worker process.
+    Param: params: buy_price, sell_price, quantity, cash, cash_reserve, commission_perc, slippage_perc
+    Return: dict with symbol, starting_cash, closing_cash, realized_gain and n_fills
+            realized_gain sums the closed trades, a position still open at the end does not count
+            None if the data could not be loaded
+    '''
+    logger = logging.getLogger(__name__)
+    market_context = MarketContext()
+    event_queue = EventQueue(logger=logger)
+    data_collector = DataCollector()
+    datahandler = DataHandler(event_queue, logger=logger)
+    datahandler.read_csv(symbol, csv_path, log=False)
+    if datahandler.datastore.get_all_symbol_data(symbol) is None:
+        logger.warning(f'run_instrument: no data loaded for {symbol} from {csv_path}')
+        return None
+
+    strategy = FixedPriceStrategy(event_queue, symbol, buy_price=params['buy_price'],
+                                  sell_price=params['sell_price'], logger=logger)
+    portfolio = Portfolio(initial_cash=params['cash'], price_source=market_context,
+                          cash_reserve=params.get('cash_reserve', 0), event_queue=event_queue,
+                          logger=logger, data_collector=data_collector)
+    broker = Broker(event_queue=event_queue, price_source=market_context,
+                    market_calendar=AlwaysOpenCalendar(),
+                    commission_perc=params.get('commission_perc', 0.0),
+                    slippage_perc=params.get('slippage_perc', 0.0), logger=logger)
+    engine = BacktestEngine(event_queue=event_queue, data_handler=datahandler, strategy=strategy,
+                            broker=broker, portfolio=portfolio, logger=logger,
+                            market_context=market_context, data_collector=data_collector)
+    engine.on_step = False
+
+    portfolio.create_new_position(symbol)
+    portfolio.select_risk_model('FIXED')
+    portfolio.set_fixed_quantity(params['quantity'])
+    datahandler.create_event_queue_lazy()
+
+    starting_cash = portfolio.cash
+    engine.run_backtest()
+    return {
+        'symbol': symbol,
+        'starting_cash': starting_cash,
+        'closing_cash': portfolio.cash,
+        'realized_gain': sum(position.realized_pnl for position in portfolio.positions.values()),
+        'n_fills': len(data_collector.fill_log)}
+
+def run_instruments(jobs: dict, params: dict, max_workers: int | None = None) -> dict:
+    '''
+    Run independent single-symbol backtests in parallel, one worker process per instrument.
+    Param: jobs: symbol -> csv_path
+    Return: symbol -> result of run_instrument
+    Callers on spawn-based platforms (Windows, macOS) must invoke this under if __name__ == '__main__'.
+    '''
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {symbol: executor.submit(run_instrument, symbol, csv_path, params)
+                   for symbol, csv_path in jobs.items()}
+        return {symbol: future.result() for symbol, future in futures.items()}
@@ -1,10 +1,9 @@
-import queue
 from datetime import datetime, timezone
 import logging
 from core.event import OrderEvent
 from core.position import Position
 from core.event import Event, MarketEvent, OrderEvent, SignalEvent, FillEvent, FillDeclinedEvent
-from core.risk import RiskManager
+from core.risk import RiskManager, PortfolioSnapshot
 
 class Portfolio:
     def __init__(self, initial_cash, price_source, cash_reserve, event_queue, logger=None, data_collector=None):
@@ -215,11 +214,12 @@ class Portfolio:
             self.logger.warning(f'Price for ticker {event.symbol}:{current_price} is invalid')
             return None
         
-        portfolio_snapshot = self._record_portfolio_snapshot()
+        portfolio_snapshot = PortfolioSnapshot(self.cash, self.cash_reserve, self.total_invested_value)
         quantity = self.riskmanager.decide_order_sizing(
             portfolio_snapshot,
-            self.positions,
-            event)
+            current_price,
+            self.positions[event.symbol].quantity,
+            event.signal_type)
 
         return quantity
 
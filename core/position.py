@@ -1,11 +1,25 @@
 import logging
+import numpy as np
+from core.event import Direction
+
+# Fill direction string -> sign of the quantity change. Events carry the strings, like Portfolio expects.
+# Only string keys: plain 1, True or 1.0 must not pass as a direction, Direction members are checked by type.
+_DIRECTION = {'BUY': 1, 'SELL': -1}
+
+def _sign(direction) -> int:
+    '''Sign of the quantity change for a 'BUY'/'SELL' string or a Direction member, 0 if invalid.'''
+    return direction if type(direction) is Direction else _DIRECTION.get(direction, 0)
 
 class Position:
+    # Fixed attribute layout: compact per-symbol state with slot-offset attribute access on every fill
+    __slots__ = ('logger', 'symbol', 'quantity', '_cost_basis', 'realized_pnl',
+                 'cumulated_commission', 'cumulated_slippage')
+
     def __init__(self, symbol, logger=None):
         self.logger = logger or logging.getLogger(__name__)
         self.symbol = symbol
         self.quantity = 0.0          # Total number of shares/contracts held
-        self.avg_cost = 0.0          # Average cost per unit
+        self._cost_basis = 0.0       # Total cost of the units held, fees included. avg_cost is derived from it
         self.realized_pnl = 0.0      # Realized profit/loss from closed trades
         self.cumulated_commission = 0.0
         self.cumulated_slippage = 0.0
@@ -23,42 +37,64 @@ class Position:
         Return: False if update failed
                 True if update succeded
         """
-        direction = fill_event.direction
-        fill_qty = fill_event.quantity
-        fill_price = fill_event.fill_price
-        commission = fill_event.commission
-        slippage = fill_event.slippage
+        return self._apply_fill(_sign(fill_event.direction), fill_event.quantity, fill_event.fill_price,
+                                fill_event.commission, fill_event.slippage)
+
+    def update_fills_batch(self, directions, quantities, prices, commissions, slippages) -> np.ndarray:
+        """
+        Apply a sequence of fills in order, e.g. when replaying a fill log.
+        Arguments are equal length sequences (lists or numpy arrays) with one entry per fill.
+        directions may be 'BUY'/'SELL' strings, Direction members or an int8 array from Direction.encode.
+        Return: bool array, True where the fill was applied.
+                Rejected fills (invalid direction, selling more than held) and zero quantity fills are False.
+        """
+        # Only integer arrays are Direction encoded, their values already are the signs.
+        # Bool and float directions stay invalid.
+        if isinstance(directions, np.ndarray) and directions.dtype.kind in 'iu':
+            signs = np.where(np.abs(directions) == 1, directions, 0).tolist()
+        else:
+            signs = [_sign(direction) for direction in directions]
+        # Native Python scalars keep the per-fill arithmetic off numpy scalar dispatch
+        columns = [column.tolist() if isinstance(column, np.ndarray) else column
+                   for column in (quantities, prices, commissions, slippages)]
+        apply_fill = self._apply_fill
+        return np.fromiter((apply_fill(*fill) is True for fill in zip(signs, *columns)),
+                           dtype=bool, count=len(signs))
 
+    def _apply_fill(self, sign, fill_qty, fill_price, commission, slippage):
+        '''sign: +1 for a buy, -1 for a sell, 0 for an invalid direction'''
         if fill_qty == 0:
             return  # No update for zero quantity fills
 
+        if sign == 0:
+            self.logger.warning(f'Invalid direction in fill event')
+            return False
+
         # If adding to position (buy)
-        if direction == 'BUY':
-            total_cost = self.avg_cost * self.quantity + fill_price * fill_qty + commission + slippage
+        if sign > 0:
+            # Only the cost delta is added, the average is divided out on demand
+            self._cost_basis += fill_price * fill_qty + commission + slippage
             self.quantity += fill_qty
-            self.avg_cost = total_cost / self.quantity if self.quantity != 0 else 0.0
-            self.cumulated_commission += commission
-            self.cumulated_slippage += slippage
-            return True
-
         # If reducing position (sell)
-        elif direction == 'SELL':
-            qty_to_close = fill_qty
-            if qty_to_close > self.quantity:
+        else:
+            if fill_qty > self.quantity:
                 self.logger.warning(f'Trying to sell more then held')
                 return False
             # Realized PnL = (Sell price - avg cost) * qty sold - commission
-            pnl = (fill_price - self.avg_cost) * qty_to_close - commission - slippage
-            self.realized_pnl += pnl
-            self.quantity -= qty_to_close
-            self.cumulated_commission += commission
-            self.cumulated_slippage += slippage
-            if self.quantity == 0:
-                self.avg_cost = 0.0
-            return True
-        else:
-            self.logger.warning(f'Invalid direction in fill event')
-            return False
+            avg_cost = self.avg_cost
+            self.realized_pnl += (fill_price - avg_cost) * fill_qty - commission - slippage
+            self.quantity -= fill_qty
+            # Rescale the basis from the remaining quantity, subtracting the sold cost would let
+            # floating point dust in the quantity drift the average
+            self._cost_basis = avg_cost * self.quantity if self.quantity != 0 else 0.0
+        self.cumulated_commission += commission
+        self.cumulated_slippage += slippage
+        return True
+
+    @property
+    def avg_cost(self):
+        """Average cost per unit held, fees included."""
+        return self._cost_basis / self.quantity if self.quantity != 0 else 0.0
 
     def market_value(self, current_price):
         """Calculate the current market value of the position."""
@@ -1,8 +1,11 @@
 from abc import ABC, abstractmethod
-from core.event import SignalEvent
+from collections import namedtuple
 from core.market_context import MarketContext
 import logging
 
+# Lightweight portfolio state handed to the risk manager on every signal
+PortfolioSnapshot = namedtuple('PortfolioSnapshot', ['cash', 'cash_reserve', 'equity'])
+
 class AbcRiskManager(ABC):
     '''
     Abstract class for defining risk management strategies.
@@ -14,8 +17,9 @@ class AbcRiskManager(ABC):
         self.price_source = price_source
     
     @abstractmethod
-    def decide_order_sizing(self,portfolio_snapshot: dict,
-                             positions: dict, event: SignalEvent) -> float:
+    def decide_order_sizing(self,portfolio_snapshot: PortfolioSnapshot,
+                             current_price: float, position_quantity: float,
+                             signal_type: str) -> float:
         order_size = 10.0
         return order_size
     
@@ -23,44 +27,46 @@ class RiskManager(AbcRiskManager):
     def __init__(self,price_source,logger=None):
         super().__init__(price_source,logger)
         self.strategy_list = ['MAX','FIXED']
-        self.strategy = 'MAX'
         self.fixed_amount = 10.0
+        # Sizing method is resolved once on model selection, not on every signal
+        self._sizing_methods = {
+            'MAX': self._max_amount,
+            'FIXED': self._fixed_amount}
+        self.select_riskmodel('MAX')
 
-    def decide_order_sizing(self,portfolio_snapshot: dict,
-                             positions: dict, event: SignalEvent) -> float:
-        if self.strategy == 'MAX':
-            return self._max_amount(portfolio_snapshot,positions,event)
-        elif self.strategy == 'FIXED':
-            return self._fixed_amount(portfolio_snapshot,positions,event)
+    def decide_order_sizing(self,portfolio_snapshot: PortfolioSnapshot,
+                             current_price: float, position_quantity: float,
+                             signal_type: str) -> float:
+        return self._sizing_method(portfolio_snapshot,current_price,position_quantity,signal_type)
 
-    def _fixed_amount(self,portfolio_snapshot: dict,
-                             positions: dict, event: SignalEvent) -> float:        
+    def _fixed_amount(self,portfolio_snapshot: PortfolioSnapshot,
+                             current_price: float, position_quantity: float,
+                             signal_type: str) -> float:        
         return self.fixed_amount
     
-    def _max_amount(self,portfolio_snapshot: dict,
-                             positions: dict, event: SignalEvent) -> float:
+    def _max_amount(self,portfolio_snapshot: PortfolioSnapshot,
+                             current_price: float, position_quantity: float,
+                             signal_type: str) -> float:
         '''
         This is a dummy sizing strategy.
         If a BUY signal comes, it will stake the whole available cash
         If a SELL signal comes, it will close the whole position
         Returns None if trade should not be executed
         '''
-        cash = portfolio_snapshot['cash']
-        cash_reserve = portfolio_snapshot['cash_reserve']
-        pos = positions[event.symbol]
-        if event.signal_type == 'BUY':
+        cash, cash_reserve, _ = portfolio_snapshot
+        if signal_type == 'BUY':
             free_cash = cash - cash_reserve
-            current_price = self.price_source.price(event.symbol)
             return free_cash/current_price
         
-        elif event.signal_type == 'SELL':
-            return pos.quantity
+        elif signal_type == 'SELL':
+            return position_quantity
     
     def select_riskmodel(self,strategy: str) -> bool:
         if strategy not in self.strategy_list:
             return False
         
         self.strategy = strategy
+        self._sizing_method = self._sizing_methods[strategy]
         return True
     
     def set_fixed_quantity(self,quantity: float):
@@ -2,6 +2,7 @@
 from abc import ABC, abstractmethod
 from core.event import Event, MarketEvent, OrderEvent, SignalEvent, FillEvent
 import logging
+import numpy as np
 
 
 class BaseStrategy(ABC):
@@ -18,6 +19,9 @@ class BaseStrategy(ABC):
 
 
 class FixedPriceStrategy(BaseStrategy):
+    # Signal emitted on a trigger, indexed by in_position
+    _SIGNAL_TYPES = ('BUY', 'SELL')
+
     def __init__(self, event_queue, symbol, buy_price, sell_price, data_handler=None, logger=None):
         """
         Parameters:
@@ -42,7 +46,44 @@ class FixedPriceStrategy(BaseStrategy):
             return None
         elif event.type == 'ORDER':
             return None
-        
+
+    @staticmethod
+    def sweep(prices, buy_grid, sell_grid) -> tuple[np.ndarray, np.ndarray]:
+        '''
+        Precompute trigger masks for a grid search over buy and sell prices.
+        Prices are compared against the whole grid once, instead of once per bar per parameter pair.
+        Return: (buy_mask, sell_mask)
+                buy_mask[i, j] is True if prices[i] <= buy_grid[j]
+                sell_mask[i, k] is True if prices[i] >= sell_grid[k]
+        A (buy_grid[j], sell_grid[k]) pair is evaluated with signals_from_masks(buy_mask[:, j], sell_mask[:, k])
+        '''
+        prices = np.asarray(prices, dtype=np.float64)
+        buy_mask = np.less_equal.outer(prices, np.asarray(buy_grid, dtype=np.float64))
+        sell_mask = np.greater_equal.outer(prices, np.asarray(sell_grid, dtype=np.float64))
+        return buy_mask, sell_mask
+
+    @staticmethod
+    def signals_from_masks(buy_triggers: np.ndarray, sell_triggers: np.ndarray) -> list[tuple[int, str]]:
+        '''
+        Replay the strategy state machine over precomputed trigger columns.
+        Jumps from one trigger to the next, so the cost scales with the number of signals, not bars.
+        Return: list of (bar index, 'BUY' | 'SELL') in the order handle_event would emit them
+        '''
+        triggers = (np.flatnonzero(buy_triggers), np.flatnonzero(sell_triggers))
+        signals = []
+        in_position = False
+        next_bar = 0
+        while True:
+            candidates = triggers[in_position]
+            k = np.searchsorted(candidates, next_bar)
+            if k == len(candidates):
+                break
+            bar = int(candidates[k])
+            signals.append((bar, FixedPriceStrategy._SIGNAL_TYPES[in_position]))
+            in_position = not in_position
+            next_bar = bar + 1
+        return signals
+
     def _handle_market_event(self, event):
         if event.symbol != self.symbol:
             return None
@@ -50,17 +91,21 @@ class FixedPriceStrategy(BaseStrategy):
         price = event.price  # Assuming event has a `price` attribute
         timestamp = event.timestamp
 
-        if not self.in_position and price <= self.buy_price:
-            signal = SignalEvent(timestamp, self.symbol, 'BUY')
-            self.in_position = True
-            self.logger.info(f"[{timestamp}] Buy signal triggered at {price}")
-            self.event_queue.put(signal)
+        # Only one threshold applies in each state, so non-triggering bars cost a single compare.
+        # Negated positive compares keep a NaN price from triggering.
+        in_position = self.in_position
+        if in_position:
+            if not price >= self.sell_price:
+                return None
+        elif not price <= self.buy_price:
+            return None
 
-        elif self.in_position and price >= self.sell_price:
-            signal = SignalEvent(timestamp, self.symbol, 'SELL')
-            self.in_position = False
-            self.logger.info(f"[{timestamp}] Sell signal triggered at {price}")
-            self.event_queue.put(signal)
+        signal_type = self._SIGNAL_TYPES[in_position]
+        signal = SignalEvent(timestamp, self.symbol, signal_type)
+        self.in_position = not in_position
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"[{timestamp}] {signal_type.capitalize()} signal triggered at {price}")
+        self.event_queue.put(signal)
         
         return None
 
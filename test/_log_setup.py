@@ -0,0 +1,30 @@
+import logging
+import sys
+
+_HANDLER_NAME = 'test_log_setup'
+
+def configure_logger(name='logger', level=logging.DEBUG, handler_level=logging.DEBUG) -> logging.Logger:
+    '''
+    Configure the shared test logger: one stdout handler, no propagation to the root logger.
+    Idempotent, so every test module can call it without stacking duplicate handlers.
+    '''
+    logger = logging.getLogger(name)
+    logger.setLevel(level)
+    handler = next((h for h in logger.handlers if h.name == _HANDLER_NAME), None)
+    if handler is None:
+        logger.handlers.clear()
+        handler = logging.StreamHandler(sys.stdout)
+        handler.name = _HANDLER_NAME
+        handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+        logger.addHandler(handler)
+    handler.setLevel(handler_level)
+    logger.propagate = False  # Don't bubble up to root logger
+    return logger
+
+def configure_backtest_logger(name='logger') -> logging.Logger:
+    '''
+    Logger setup for modules that run full backtests.
+    These emit per-signal INFO records, so only warnings and errors are shown.
+    Lower the level to logging.DEBUG here when tracing a single failing run.
+    '''
+    return configure_logger(name, level=logging.WARNING)
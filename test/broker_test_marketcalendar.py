@@ -1,23 +1,18 @@
 import unittest
 from unittest.mock import Mock, MagicMock
 from datetime import datetime
-import sys
-import os
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from _log_setup import configure_logger
 from core.broker import Broker
 from core.core import EventQueue
 from core.market_context import MarketContext
 from core.event import OrderEvent
 import logging
 
-# Setup logger to print to console
+# --- Logger Setup ---
 logger = logging.getLogger('logger')
-logger.setLevel(logging.DEBUG)  # Set minimum level to DEBUG
-console_handler = logging.StreamHandler()
-console_handler.setLevel(logging.DEBUG)  # Also handle DEBUG level logs
-formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-console_handler.setFormatter(formatter)
-logger.addHandler(console_handler)
+
+def setUpModule():
+    configure_logger()
 
 class TestBroker(unittest.TestCase):
     def setUp(self):
@@ -3,13 +3,11 @@ from unittest.mock import patch, MagicMock, Mock
 import pandas as pd
 from datetime import datetime
 import os
-import sys
 import logging
 import yfinance as yf
 from time import time
 
-# --- Add parent directory to path for importing DataStore ---
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from _log_setup import configure_backtest_logger
 from core.data_handler import DataHandler
 from core.core import BacktestEngine
 from core.broker import Broker
@@ -17,34 +15,20 @@ from core.portfolio import Portfolio
 from core.position import Position
 from core.strategy import FixedPriceStrategy
 from core.core import EventQueue
+from core.market_calendar import AlwaysOpenCalendar
 from core.metrics import DataCollector
 from core.market_context import MarketContext
 
 # --- Logger Setup ---
 logger = logging.getLogger('logger')
-logger.setLevel(logging.DEBUG)
 
-# Clear any existing handlers
-if logger.hasHandlers():
-    logger.handlers.clear()
-
-# Create and configure new stream handler to stdout
-stream_handler = logging.StreamHandler(sys.stdout)
-stream_handler.setLevel(logging.DEBUG)
-formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-stream_handler.setFormatter(formatter)
-logger.addHandler(stream_handler)
-logger.propagate = False  # Don't bubble up to root logger
+def setUpModule():
+    configure_backtest_logger()
 
 class TestCore(unittest.TestCase):
 
     def setUp(self):
-        self.market_calendar = Mock()
-
-        def mock_is_market_open(timestamp, symbol):
-            return True
-        
-        self.market_calendar.is_market_open.side_effect = mock_is_market_open
+        self.market_calendar = AlwaysOpenCalendar()
 
         self.event_queue = EventQueue(logger=logger)
 
@@ -82,7 +66,7 @@ class TestCore(unittest.TestCase):
         
         #Check frames shapes at initiation
         self.assertFalse(self.datahandler.datastore.data)
-        logger.info(f'Data: {self.datahandler.datastore.data}')
+        logger.info('Data: %s', self.datahandler.datastore.data)
 
         self.datahandler.read_csv('BTC-USD',r'C:\backtester\dev\btcusd.csv')
 
@@ -94,7 +78,10 @@ class TestCore(unittest.TestCase):
 
         #Test that wrote CSV is shame shape as self.data
         self.datahandler.write_csv('BTC-USD','test.csv')
-        reread_data = pd.read_csv('test.csv',index_col=1)
+        reread_data = pd.read_csv('test.csv', index_col='Date', parse_dates=['Date'], engine='c',
+                                  dtype={'Symbol':'string', 'Open':'float64', 'High':'float64', 'Low':'float64',
+                                         'Close':'float64', 'Volume':'float64', 'Dividend':'float64',
+                                         'StockSplit':'float64'})
         self.assertEqual(self.datahandler.datastore.data['BTC-USD'].shape,reread_data.shape)
         #os.remove('test.csv')
         self.datahandler.logger.info('test_data_handler_setupflow end')
@@ -2,14 +2,11 @@ import unittest
 from unittest.mock import patch, MagicMock, Mock
 import pandas as pd
 from datetime import datetime
-import os
-import sys
 import logging
 import yfinance as yf
 from time import time
 
-# --- Add parent directory to path for importing DataStore ---
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from _log_setup import configure_backtest_logger
 from core.data_handler import DataHandler
 from core.core import BacktestEngine
 from core.broker import Broker
@@ -17,34 +14,20 @@ from core.portfolio import Portfolio
 from core.position import Position
 from core.strategy import FixedPriceStrategy
 from core.core import EventQueue
+from core.market_calendar import AlwaysOpenCalendar
 from core.metrics import DataCollector
 from core.market_context import MarketContext
 
 # --- Logger Setup ---
 logger = logging.getLogger('logger')
-logger.setLevel(logging.DEBUG)
 
-# Clear any existing handlers
-if logger.hasHandlers():
-    logger.handlers.clear()
-
-# Create and configure new stream handler to stdout
-stream_handler = logging.StreamHandler(sys.stdout)
-stream_handler.setLevel(logging.DEBUG)
-formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-stream_handler.setFormatter(formatter)
-logger.addHandler(stream_handler)
-logger.propagate = False  # Don't bubble up to root logger
+def setUpModule():
+    configure_backtest_logger()
 
 class TestCore(unittest.TestCase):
 
     def setUp(self):
-        self.market_calendar = Mock()
-
-        def mock_is_market_open(timestamp, symbol):
-            return True
-        
-        self.market_calendar.is_market_open.side_effect = mock_is_market_open
+        self.market_calendar = AlwaysOpenCalendar()
 
         self.event_queue = EventQueue(logger=logger)
 
@@ -82,14 +65,14 @@ class TestCore(unittest.TestCase):
         self.datahandler.create_event_queue_lazy()
         created = self.portfolio.create_new_position('BTC-USD')
         self.engine.run_backtest()
-        log1 = pd.DataFrame(self.data_collector.portfolio_log)
-        log2 = pd.DataFrame(self.data_collector.fill_log)
-        log3 = pd.DataFrame(self.data_collector.event_log)
-        log4 = pd.DataFrame(self.data_collector.position_log)
-        log1.to_csv('log1.csv')
-        log2.to_csv('log2.csv')
-        log3.to_csv('log3.csv')
-        log4.to_csv('log4.csv')
+        log1 = self.data_collector.to_frame('portfolio_log')
+        log2 = self.data_collector.to_frame('fill_log')
+        log3 = self.data_collector.to_frame('event_log')
+        log4 = self.data_collector.to_frame('position_log')
+        log1.to_csv('log1.csv', float_format='%.6f', lineterminator='\n')
+        log2.to_csv('log2.csv', float_format='%.6f', lineterminator='\n')
+        log3.to_csv('log3.csv', float_format='%.6f', lineterminator='\n')
+        log4.to_csv('log4.csv', float_format='%.6f', lineterminator='\n')
         
 if __name__ == '__main__':
     unittest.main()
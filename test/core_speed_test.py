@@ -11,6 +11,7 @@ import cProfile
 
 # --- Add parent directory to path for importing DataStore ---
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from _log_setup import configure_logger
 from core.data_handler import DataHandler
 from core.core import BacktestEngine
 from core.broker import Broker
@@ -18,24 +19,14 @@ from core.portfolio import Portfolio
 from core.position import Position
 from core.strategy import FixedPriceStrategy
 from core.core import EventQueue
-from core.metrics import DataCollector
+from core.market_calendar import AlwaysOpenCalendar
+from core.metrics import NullDataCollector
+from core.market_context import MarketContext
+from core.engine_kernel import run_fixed_price
 from utils.pattern_generator import PatternGenerator
 
 # --- Logger Setup ---
 logger = logging.getLogger('logger')
-logger.setLevel(logging.DEBUG)
-
-# Clear any existing handlers
-if logger.hasHandlers():
-    logger.handlers.clear()
-
-# Create and configure new stream handler to stdout
-stream_handler = logging.StreamHandler(sys.stdout)
-stream_handler.setLevel(logging.DEBUG)
-formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-stream_handler.setFormatter(formatter)
-logger.addHandler(stream_handler)
-logger.propagate = False  # Don't bubble up to root logger
 
 class SpeedTest:
     '''
@@ -79,26 +70,25 @@ class SpeedTest:
             self.open1,self.high1,self.low1,self.close1,self.days)
 
 
-        self.market_calendar = Mock()
-        def mock_is_market_open(timestamp, symbol):
-            return True
-        
-        self.market_calendar.is_market_open.side_effect = mock_is_market_open
+        self.market_calendar = AlwaysOpenCalendar()
+
+        self.market_context = MarketContext()
 
         self.event_queue = EventQueue(logger=logger)
 
-        self.data_collector = DataCollector()
+        # Logs are not inspected here, so snapshots are discarded instead of collected
+        self.data_collector = NullDataCollector()
 
         self.strategy = FixedPriceStrategy(self.event_queue,'A',buy_price=self.buy_price,
                                            sell_price=self.sell_price,logger=logger)
 
-        self.portfolio = Portfolio(initial_cash=self.cash,cash_reserve=self.cash_reserve,
+        self.portfolio = Portfolio(initial_cash=self.cash,price_source=self.market_context,cash_reserve=self.cash_reserve,
                                    event_queue=self.event_queue,logger=logger,data_collector=self.data_collector)
 
         self.datahandler = DataHandler(self.event_queue,logger=logger)
 
         self.broker = Broker(event_queue=self.event_queue,
-                             price_source=self.datahandler,
+                             price_source=self.market_context,
                              market_calendar=self.market_calendar,
                              commission_perc=0.0,
                              slippage_perc=0.0,
@@ -109,7 +99,8 @@ class SpeedTest:
                                      strategy=self.strategy,
                                      broker=self.broker,
                                      portfolio=self.portfolio,
-                                     logger=logger, data_collector=self.data_collector)
+                                     logger=logger, market_context=self.market_context,
+                                     data_collector=self.data_collector)
 
         self.portfolio.enable_snapshots = False
         self.portfolio.enable_trade_log = False
@@ -145,11 +136,29 @@ class SpeedTest:
     def run_engine(self):
         self.engine.run_backtest()
         self.closing_cash = self.portfolio.cash
-        logger.info(f'Theoretical gains: {self.gain}')
-        logger.info(f'Realized gains: {self.closing_cash-self.starting_cash}')
+        print(f'Theoretical gains: {self.gain}')
+        print(f'Realized gains: {self.closing_cash-self.starting_cash}')
+
+    def run_fast_path(self):
+        '''
+        Same backtest as run_engine, but bypassing the event queue and the component objects.
+        Used as a reference for how much of the runtime is spent on event dispatch.
+        '''
+        df = self.datahandler.datastore.get_all_symbol_data('A')
+        closing_cash, _ = run_fixed_price(
+            df['Open'].to_numpy(), df['Close'].to_numpy(),
+            self.buy_price, self.sell_price, self.portfolio.riskmanager.fixed_amount, self.starting_cash,
+            self.broker.commission_perc, self.broker.slippage_perc)
+        print(f'Fast path realized gains: {closing_cash-self.starting_cash}')
+        return closing_cash
 
 if __name__ == '__main__':
+    # Per-signal INFO/DEBUG messages would dominate the profile, only warnings are logged, results are printed
+    configure_logger(level=logging.WARNING)
     test = SpeedTest()
     test.setup_run()
+    start = time()
+    test.run_fast_path()
+    print(f'Fast path runtime: {time()-start:.4f}s')
     cProfile.run('test.run_engine()', filename='profile.prof')
 
@@ -2,14 +2,11 @@ import unittest
 from unittest.mock import patch, MagicMock, Mock
 import pandas as pd
 from datetime import datetime
-import os
-import sys
 import logging
 import yfinance as yf
 from time import time
 
-# --- Add parent directory to path for importing DataStore ---
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from _log_setup import configure_backtest_logger
 from core.data_handler import DataHandler
 from core.core import BacktestEngine
 from core.broker import Broker
@@ -17,25 +14,16 @@ from core.portfolio import Portfolio
 from core.position import Position
 from core.strategy import FixedPriceStrategy
 from core.core import EventQueue
+from core.market_calendar import AlwaysOpenCalendar
 from core.metrics import DataCollector
 from core.market_context import MarketContext
 from utils.pattern_generator import PatternGenerator
 
 # --- Logger Setup ---
 logger = logging.getLogger('logger')
-logger.setLevel(logging.DEBUG)
 
-# Clear any existing handlers
-if logger.hasHandlers():
-    logger.handlers.clear()
-
-# Create and configure new stream handler to stdout
-stream_handler = logging.StreamHandler(sys.stdout)
-stream_handler.setLevel(logging.DEBUG)
-formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-stream_handler.setFormatter(formatter)
-logger.addHandler(stream_handler)
-logger.propagate = False  # Don't bubble up to root logger
+def setUpModule():
+    configure_backtest_logger()
 
 class TestCore(unittest.TestCase):
     '''
@@ -51,36 +39,35 @@ class TestCore(unittest.TestCase):
     -----------------------------------------------------------------------------------------
     '''
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         # Open==Close=10
-        self.open1 = 10
-        self.high1 = 11
-        self.low1 = 9
-        self.close1 = 10
+        cls.open1 = 10
+        cls.high1 = 11
+        cls.low1 = 9
+        cls.close1 = 10
         # Open==Close==5
-        self.open2 = 5
-        self.high2 = 6
-        self.low2 = 5
-        self.close2 = 5
-        self.days = 100
+        cls.open2 = 5
+        cls.high2 = 6
+        cls.low2 = 5
+        cls.close2 = 5
+        cls.days = 100
         #Buy on day2 sell on day3
-        self.buy_price = 6
-        self.sell_price = 9
+        cls.buy_price = 6
+        cls.sell_price = 9
         #Portfolio setup
-        self.cash = 10000
-        self.cash_reserve = 1000
+        cls.cash = 10000
+        cls.cash_reserve = 1000
 
-        self.pattern_generator = PatternGenerator()
-        self.pattern = self.pattern_generator.fixed_oscillating(
-            'A',self.open2,self.high2,self.low2,self.close2,
-            self.open1,self.high1,self.low1,self.close1,self.days)
+        # The pattern is read-only input, generate and validate it once for all tests
+        cls.pattern_generator = PatternGenerator()
+        cls.pattern = cls.pattern_generator.fixed_oscillating(
+            'A',cls.open2,cls.high2,cls.low2,cls.close2,
+            cls.open1,cls.high1,cls.low1,cls.close1,cls.days)
 
-
-        self.market_calendar = Mock()
-        def mock_is_market_open(timestamp, symbol):
-            return True
-        
-        self.market_calendar.is_market_open.side_effect = mock_is_market_open
+    def setUp(self):
+        # Engine components carry portfolio, position and queue state, so they are rebuilt per test
+        self.market_calendar = AlwaysOpenCalendar()
 
         self.price_source = MarketContext()
 
@@ -138,19 +125,41 @@ class TestCore(unittest.TestCase):
         self.broker.slippage_perc = 0.0
         self.engine.run_backtest()
         closing_cash = self.portfolio.cash
-        log1 = pd.DataFrame(self.data_collector.portfolio_log)
-        log2 = pd.DataFrame(self.data_collector.fill_log)
-        log3 = pd.DataFrame(self.data_collector.event_log)
-        log4 = pd.DataFrame(self.data_collector.position_log)
-        log1.to_csv('portfoliolog.csv')
-        log2.to_csv('filllog.csv')
-        log3.to_csv('eventlog.csv')
-        log4.to_csv('positionlog.csv')
-        logger.info(f'Theoretical gains: {gain}')
-        logger.info(f'Realized gains: {closing_cash-starting_cash}')
+        log1 = self.data_collector.to_frame('portfolio_log')
+        log2 = self.data_collector.to_frame('fill_log')
+        log3 = self.data_collector.to_frame('event_log')
+        log4 = self.data_collector.to_frame('position_log')
+        log1.to_csv('portfoliolog.csv', float_format='%.6f', lineterminator='\n')
+        log2.to_csv('filllog.csv', float_format='%.6f', lineterminator='\n')
+        log3.to_csv('eventlog.csv', float_format='%.6f', lineterminator='\n')
+        log4.to_csv('positionlog.csv', float_format='%.6f', lineterminator='\n')
+        logger.info('Theoretical gains: %s', gain)
+        logger.info('Realized gains: %s', closing_cash-starting_cash)
         self.assertAlmostEqual(closing_cash-starting_cash,gain)
 
 
+    def test_run_without_data_collector(self):
+        '''
+        The engine must run without a data collector when snapshots and the trade log are disabled
+        '''
+        buy_quantity = 10.0
+        gain = (self.close1-self.close2)*(self.days // 2)*buy_quantity
+
+        self.portfolio.data_collector = None
+        self.portfolio.enable_snapshots = False
+        self.portfolio.enable_trade_log = False
+        self.engine.data_collector = None
+        self.engine.on_step = False
+
+        starting_cash = self.portfolio.cash
+        self.datahandler.write_symbol_data('A',self.pattern)
+        self.datahandler.create_event_queue_lazy()
+        self.portfolio.create_new_position('A')
+        self.portfolio.select_risk_model('FIXED')
+        self.portfolio.set_fixed_quantity(buy_quantity)
+        self.engine.run_backtest()
+        self.assertAlmostEqual(self.portfolio.cash-starting_cash,gain)
+
     def test_run_with_fees(self):
         '''
         Test that calculated cash matches theoretical value
@@ -180,38 +189,51 @@ class TestCore(unittest.TestCase):
 
         self.engine.run_backtest()
         closing_cash = self.portfolio.cash
-        logger.info(f'Theoretical gains: {gain}')
-        logger.info(f'Realized gains: {closing_cash-starting_cash}')
+        logger.info('Theoretical gains: %s', gain)
+        logger.info('Realized gains: %s', closing_cash-starting_cash)
         self.assertAlmostEqual(closing_cash-starting_cash,gain)
 
     def test_run_with_multiple_fees(self):
         fee_range = [i*0.01 for i in range(10)]
+        self.assertEqual(self.days%2,0) # Check that trades can be closed, by checking days even
+        # Fixed quantity that will be bought every trade
+        buy_quantity = 10.0 
+        # Spread that can be made with fixed price strategy in one buy-sell
+        spread = self.close1-self.close2
+        rounds = self.days // 2
+
+        # Position and risk model are set up once, every run closes its position so they carry over
+        self.portfolio.create_new_position('A')
+        self.portfolio.select_risk_model('FIXED')
+        self.portfolio.set_fixed_quantity(buy_quantity)
+
+        self.datahandler.write_symbol_data('A',self.pattern)
+        self.datahandler.create_event_queue_lazy()
+        # The engine drains the queue, so the market events are kept and replayed for every fee value
+        market_events = []
+        while not self.event_queue.is_empty():
+            market_events.append(self.event_queue.get())
+        # get() pops the last put event first, reversing restores the put order
+        market_events.reverse()
+
         for i in fee_range:
             self.broker.commission_perc = i
             self.broker.slippage_perc = i
 
-            self.assertEqual(self.days%2,0) # Check that trades can be closed, by checking days even
-            # Fixed quantity that will be bought every trade
-            buy_quantity = 10.0 
-            # Spread that can be made with fixed price strategy in one buy-sell
-            spread = self.close1-self.close2
             buy_side_fees = self.close2 * (self.broker.commission_perc + self.broker.slippage_perc)
             sell_side_fees = self.close1 * (self.broker.commission_perc + self.broker.slippage_perc)
-            rounds = self.days // 2
             gain = (spread-sell_side_fees-buy_side_fees)*rounds*buy_quantity
 
             starting_cash = self.portfolio.cash
-            self.datahandler.write_symbol_data('A',self.pattern)
-            self.datahandler.create_event_queue_lazy()
-            self.portfolio.create_new_position('A')
-            self.portfolio.select_risk_model('FIXED')
-            self.portfolio.set_fixed_quantity(buy_quantity)
+            if self.event_queue.is_empty():
+                self.event_queue.put_many(market_events)
 
             self.engine.run_backtest()
             closing_cash = self.portfolio.cash
-            logger.info(f'Theoretical gains: {gain}')
-            logger.info(f'Realized gains: {closing_cash-starting_cash}')
+            logger.info('Theoretical gains: %s', gain)
+            logger.info('Realized gains: %s', closing_cash-starting_cash)
             self.assertAlmostEqual(closing_cash-starting_cash,gain)
+            self.assertEqual(self.portfolio.positions['A'].quantity,0)
 
 if __name__ == '__main__':
     unittest.main()
@@ -2,32 +2,18 @@ import unittest
 from unittest.mock import patch, MagicMock
 import pandas as pd
 from datetime import datetime
-import os
-import sys
 import logging
-from copy import deepcopy
 
 
-# --- Add parent directory to path for importing DataStore ---
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from _log_setup import configure_logger
 from core.data_handler2 import DataHandler
 from core.core import EventQueue
 
 # --- Logger Setup ---
 logger = logging.getLogger('logger')
-logger.setLevel(logging.DEBUG)
 
-# Clear any existing handlers
-if logger.hasHandlers():
-    logger.handlers.clear()
-
-# Create and configure new stream handler to stdout
-stream_handler = logging.StreamHandler(sys.stdout)
-stream_handler.setLevel(logging.INFO)
-formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-stream_handler.setFormatter(formatter)
-logger.addHandler(stream_handler)
-logger.propagate = False  # Don't bubble up to root logger
+def setUpModule():
+    configure_logger(handler_level=logging.INFO)
 
 
 # --- Unit Tests ---
@@ -95,7 +81,7 @@ class TestDataStore(unittest.TestCase):
         ])
         self.ds.data_for_market_event = self.ds.data_for_market_event.set_index('Date')
         # Make deep copy of data before calling
-        data_before = deepcopy(self.ds.data)
+        data_before = {symbol: df.copy(deep=True) for symbol, df in self.ds.data.items()}
         
         # Call the method
         self.ds.create_data_for_eventqueue()
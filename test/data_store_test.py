@@ -0,0 +1,27 @@
+import unittest
+import numpy as np
+import pandas as pd
+from core.data_handler import DataStore
+from utils.pattern_generator import PatternGenerator
+
+class TestDataStoreTimestamps(unittest.TestCase):
+    def setUp(self):
+        self.datastore = DataStore()
+        self.pattern = PatternGenerator().fixed_oscillating('A', 10, 11, 9, 10, 5, 6, 4, 5, 3)
+        self.datastore.write_data('A', self.pattern)
+
+    def test_timestamps_are_int64_nanoseconds(self):
+        timestamps = self.datastore.get_timestamps_ns('A')
+        self.assertEqual(timestamps.dtype, np.int64)
+        self.assertEqual(timestamps.tolist(), [ts.value for ts in self.pattern.index])
+        self.assertEqual(int(timestamps[1] - timestamps[0]), pd.Timedelta(days=1).value)
+
+    def test_non_nanosecond_index_is_converted(self):
+        self.datastore.write_data('B', self.pattern.set_axis(self.pattern.index.as_unit('s')))
+        self.assertEqual(self.datastore.get_timestamps_ns('B').tolist(), self.datastore.get_timestamps_ns('A').tolist())
+
+    def test_unknown_symbol(self):
+        self.assertIsNone(self.datastore.get_timestamps_ns('MISSING'))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import unittest
+import logging
+import numpy as np
+from core.core import BacktestEngine, EventQueue
+from core.broker import Broker
+from core.portfolio import Portfolio
+from core.strategy import FixedPriceStrategy
+from core.data_handler import DataHandler
+from core.market_calendar import AlwaysOpenCalendar
+from core.market_context import MarketContext
+from core.metrics import DataCollector
+from core.engine_kernel import run_fixed_price
+from utils.pattern_generator import PatternGenerator
+
+class TestRunFixedPrice(unittest.TestCase):
+    def setUp(self):
+        # Price oscillates between 5 and 10, open == close on every bar
+        self.days = 100
+        self.prices = np.tile([5.0, 10.0], self.days // 2)
+        self.quantity = 10.0
+        self.cash = 10000.0
+
+    def test_gain_without_fees(self):
+        cash, fills = run_fixed_price(self.prices, self.prices, 6, 9, self.quantity, self.cash)
+        rounds = self.days // 2
+        self.assertAlmostEqual(cash - self.cash, (10.0 - 5.0) * rounds * self.quantity)
+        self.assertEqual(len(fills), 2 * rounds)
+        self.assertEqual(fills[0], (0, 'BUY', 5.0))
+        self.assertEqual(fills[1], (1, 'SELL', 10.0))
+
+    def test_gain_with_fees(self):
+        fee = 0.005
+        cash, _ = run_fixed_price(self.prices, self.prices, 6, 9, self.quantity, self.cash, fee, fee)
+        rounds = self.days // 2
+        gain = (10.0 - 5.0 - 10.0 * 2 * fee - 5.0 * 2 * fee) * rounds * self.quantity
+        self.assertAlmostEqual(cash - self.cash, gain)
+
+    def test_unpaid_buy_still_flips_state(self):
+        # The first buy is not covered, but the strategy is in position and the next bar sells
+        cash, fills = run_fixed_price(self.prices[:2], self.prices[:2], 6, 9, self.quantity, 10.0)
+        self.assertEqual(cash, 110.0)
+        self.assertEqual(fills, [(1, 'SELL', 10.0)])
+
+class TestRunFixedPriceMatchesEngine(unittest.TestCase):
+    '''Kernel and event-driven engine on the same pattern must end with the same cash and fills.'''
+    days = 100
+    quantity = 10.0
+
+    def setUp(self):
+        self.pattern = PatternGenerator().fixed_oscillating('A', 5, 6, 5, 5, 10, 11, 9, 10, self.days)
+
+    def run_engine(self, cash, commission_perc, slippage_perc):
+        logger = logging.getLogger(f'{__name__}.engine')
+        logger.disabled = True  # Unpaid buys log declined fills, expected here
+        market_context = MarketContext()
+        event_queue = EventQueue(logger=logger)
+        data_collector = DataCollector()
+        datahandler = DataHandler(event_queue, logger=logger)
+        datahandler.write_symbol_data('A', self.pattern)
+        strategy = FixedPriceStrategy(event_queue, 'A', buy_price=6, sell_price=9, logger=logger)
+        portfolio = Portfolio(initial_cash=cash, price_source=market_context, cash_reserve=0,
+                              event_queue=event_queue, logger=logger, data_collector=data_collector)
+        broker = Broker(event_queue=event_queue, price_source=market_context, market_calendar=AlwaysOpenCalendar(),
+                        commission_perc=commission_perc, slippage_perc=slippage_perc, logger=logger)
+        engine = BacktestEngine(event_queue=event_queue, data_handler=datahandler, strategy=strategy,
+                                broker=broker, portfolio=portfolio, logger=logger,
+                                market_context=market_context, data_collector=data_collector)
+        engine.on_step = False
+        portfolio.create_new_position('A')
+        portfolio.select_risk_model('FIXED')
+        portfolio.set_fixed_quantity(self.quantity)
+        datahandler.create_event_queue_lazy()
+        engine.run_backtest()
+        fills = [(fill['direction'], fill['fill_price']) for fill in data_collector.fill_log]
+        return portfolio.cash, fills
+
+    def test_same_results(self):
+        for cash, commission_perc, slippage_perc in [(10000.0, 0.0, 0.0), (10000.0, 0.005, 0.005),
+                                                     (30.0, 0.0, 0.0), (30.0, 0.005, 0.005)]:
+            with self.subTest(cash=cash, commission_perc=commission_perc):
+                engine_cash, engine_fills = self.run_engine(cash, commission_perc, slippage_perc)
+                kernel_cash, kernel_fills = run_fixed_price(
+                    self.pattern['Open'], self.pattern['Close'], 6, 9, self.quantity, cash,
+                    commission_perc, slippage_perc)
+                self.assertAlmostEqual(kernel_cash, engine_cash)
+                self.assertEqual([(direction, price) for _, direction, price in kernel_fills], engine_fills)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+from datetime import datetime
+import pandas as pd
+from core.market_calendar import MarketCalendar
+
+class TestMarketCalendar(unittest.TestCase):
+    def setUp(self):
+        self.calendar = MarketCalendar()
+        opens = [datetime(2024, 1, day, 9, 30) for day in (2, 3, 4)]
+        closes = [datetime(2024, 1, day, 16, 0) for day in (2, 3, 4)]
+        self.assertTrue(self.calendar.set_sessions('AAPL', opens, closes))
+
+    def test_symbol_without_sessions_is_open(self):
+        self.assertTrue(self.calendar.is_market_open(datetime(2024, 1, 1, 3, 0), 'BTC'))
+
+    def test_inside_session(self):
+        self.assertTrue(self.calendar.is_market_open(datetime(2024, 1, 3, 9, 30), 'AAPL'))
+        self.assertTrue(self.calendar.is_market_open(datetime(2024, 1, 3, 12, 0), 'AAPL'))
+
+    def test_outside_session(self):
+        self.assertFalse(self.calendar.is_market_open(datetime(2024, 1, 1, 12, 0), 'AAPL'))
+        self.assertFalse(self.calendar.is_market_open(datetime(2024, 1, 3, 16, 0), 'AAPL'))
+        self.assertFalse(self.calendar.is_market_open(datetime(2024, 1, 3, 20, 0), 'AAPL'))
+        self.assertFalse(self.calendar.is_market_open(datetime(2024, 1, 5, 12, 0), 'AAPL'))
+
+    def test_invalid_sessions_rejected(self):
+        opens = [datetime(2024, 1, 2, 16, 0)]
+        closes = [datetime(2024, 1, 2, 9, 30)]
+        self.assertFalse(self.calendar.set_sessions('MSFT', opens, closes))
+        self.assertNotIn('MSFT', self.calendar.sessions)
+
+    def test_tz_aware_sessions(self):
+        opens = pd.DatetimeIndex([datetime(2024, 1, 2, 9, 30)]).tz_localize('America/New_York')
+        closes = pd.DatetimeIndex([datetime(2024, 1, 2, 16, 0)]).tz_localize('America/New_York')
+        self.assertTrue(self.calendar.set_sessions('SPY', opens, closes))
+        # 15:00 UTC is 10:00 in New York, 22:00 UTC is 17:00
+        self.assertTrue(self.calendar.is_market_open(pd.Timestamp('2024-01-02 15:00', tz='UTC'), 'SPY'))
+        self.assertFalse(self.calendar.is_market_open(pd.Timestamp('2024-01-02 22:00', tz='UTC'), 'SPY'))
+
+    def test_naive_and_aware_times_not_compared(self):
+        with self.assertRaises(ValueError):
+            self.calendar.is_market_open(pd.Timestamp('2024-01-03 12:00', tz='UTC'), 'AAPL')
+        opens = pd.DatetimeIndex([datetime(2024, 1, 2, 9, 30)]).tz_localize('America/New_York')
+        self.assertTrue(self.calendar.set_sessions('SPY', opens, opens + pd.Timedelta(hours=6, minutes=30)))
+        with self.assertRaises(ValueError):
+            self.calendar.is_market_open(datetime(2024, 1, 2, 12, 0), 'SPY')
+        self.assertFalse(self.calendar.set_sessions('MSFT', opens, [datetime(2024, 1, 2, 16, 0)]))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+import unittest
+import pandas as pd
+from core.metrics import DataCollector
+
+class TestDataCollector(unittest.TestCase):
+    def setUp(self):
+        self.collector = DataCollector()
+
+    def snapshot(self, i):
+        return {'timestamp': pd.Timestamp('2024-01-01') + pd.Timedelta(days=i),
+                'cash': 100.0 - i, 'cash_reserve': 10, 'equity': float(i)}
+
+    def test_snapshots_to_frame(self):
+        for i in range(3):
+            self.collector.portfolio_snapshot(self.snapshot(i))
+        df = self.collector.to_frame('portfolio_log')
+        self.assertEqual(list(df.columns), ['timestamp', 'cash', 'cash_reserve', 'equity'])
+        self.assertEqual(len(df), 3)
+        self.assertEqual(df['cash'].tolist(), [100.0, 99.0, 98.0])
+        self.assertEqual(df['timestamp'].iloc[-1], pd.Timestamp('2024-01-03'))
+
+    def test_values_kept_as_given(self):
+        self.collector.portfolio_snapshot({'cash': 100.0, 'note': '2.5'})
+        self.collector.portfolio_snapshot({'cash': 99.0, 'note': True})
+        self.assertEqual(self.collector.portfolio_log[0]['note'], '2.5')
+        self.assertIs(self.collector.portfolio_log[1]['note'], True)
+        self.assertEqual(self.collector.to_frame('portfolio_log')['note'].tolist(), ['2.5', True])
+
+    def test_clear(self):
+        self.collector.portfolio_snapshot(self.snapshot(0))
+        self.collector.position_snapshot({'symbol': 'A', 'quantity': 1.0})
+        self.collector.clear()
+        self.assertEqual(len(self.collector.to_frame('portfolio_log')), 0)
+        self.assertEqual(self.collector.position_log, [])
+
+if __name__ == '__main__':
+    unittest.main()
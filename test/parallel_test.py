@@ -0,0 +1,55 @@
+import unittest
+import os
+import tempfile
+from core.parallel import run_instrument, run_instruments
+from utils.pattern_generator import PatternGenerator
+
+class TestRunInstruments(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Price oscillates between 5 and 10, open == close on every bar
+        cls.days = 100
+        cls.symbols = ['A', 'B', 'C', 'D']
+        cls.tmpdir = tempfile.TemporaryDirectory()
+        generator = PatternGenerator()
+        cls.jobs = {}
+        for symbol in cls.symbols:
+            pattern = generator.fixed_oscillating(symbol, 5, 6, 5, 5, 10, 11, 9, 10, cls.days)
+            path = os.path.join(cls.tmpdir.name, f'{symbol}.csv')
+            pattern.to_csv(path)
+            cls.jobs[symbol] = path
+        cls.params = {'buy_price': 6, 'sell_price': 9, 'quantity': 10.0,
+                      'cash': 10000, 'cash_reserve': 1000}
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmpdir.cleanup()
+
+    def test_run_instrument(self):
+        result = run_instrument('A', self.jobs['A'], self.params)
+        rounds = self.days // 2
+        self.assertAlmostEqual(result['realized_gain'], (10 - 5) * rounds * self.params['quantity'])
+        self.assertEqual(result['n_fills'], 2 * rounds)
+
+    def test_open_position_not_realized(self):
+        # Five bars: two closed round trips, the last buy is still open at the end
+        generator = PatternGenerator()
+        path = os.path.join(self.tmpdir.name, 'open.csv')
+        generator.fixed_oscillating('A', 5, 6, 5, 5, 10, 11, 9, 10, 5).to_csv(path)
+        result = run_instrument('A', path, self.params)
+        self.assertAlmostEqual(result['realized_gain'], (10 - 5) * 2 * self.params['quantity'])
+        self.assertAlmostEqual(result['closing_cash'] - result['starting_cash'], 50.0)
+
+    def test_missing_file(self):
+        self.assertIsNone(run_instrument('A', os.path.join(self.tmpdir.name, 'missing.csv'), self.params))
+
+    def test_run_instruments_parallel(self):
+        results = run_instruments(self.jobs, self.params, max_workers=2)
+        self.assertEqual(sorted(results), self.symbols)
+        for symbol, result in results.items():
+            self.assertEqual(set(result), {'symbol', 'starting_cash', 'closing_cash', 'realized_gain', 'n_fills'})
+            self.assertEqual(result['symbol'], symbol)
+            self.assertAlmostEqual(result['realized_gain'], results['A']['realized_gain'])
+
+if __name__ == '__main__':
+    unittest.main()
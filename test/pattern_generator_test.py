@@ -0,0 +1,52 @@
+import unittest
+from unittest.mock import patch
+from core.data_handler import DataValidators
+from utils.pattern_generator import PatternGenerator
+
+class TestPatternGenerator(unittest.TestCase):
+    def setUp(self):
+        self.generator = PatternGenerator()
+
+    def generate(self, n=5, **kwargs):
+        return self.generator.fixed_oscillating('A', 10, 11, 9, 10, 5, 6, 4, 5, n, **kwargs)
+
+    def test_pattern_passes_schema(self):
+        df = self.generate(validate=True)
+        self.assertTrue(DataValidators().ohlcv_validate(df))
+
+    def test_pattern_values(self):
+        df = self.generate()
+        self.assertEqual(list(df.columns), ['Symbol', 'Open', 'High', 'Low', 'Close', 'Volume', 'Dividend', 'StockSplit'])
+        self.assertEqual(df['Open'].tolist(), [10.0, 5.0, 10.0, 5.0, 10.0])
+        self.assertEqual(df['Low'].tolist(), [9.0, 4.0, 9.0, 4.0, 9.0])
+        self.assertTrue((df['Volume'] == 10).all())
+        self.assertTrue(df['StockSplit'].isna().all())
+        self.assertTrue(df.index.is_monotonic_increasing)
+
+    def test_stocksplit_pattern(self):
+        self.assertEqual(self.generate(n=7, stocksplit=[1, 2, 3])['StockSplit'].tolist(), [1, 2, 3, 1, 2, 3, 1])
+        self.assertEqual(self.generate(n=3, stocksplit=2)['StockSplit'].tolist(), [2, 2, 2])
+        self.assertEqual(self.generate(n=3, stocksplit=[])['StockSplit'].tolist(), [0.0, 0.0, 0.0])
+
+    def test_patterns_do_not_share_index(self):
+        first = self.generate()
+        first.index.name = 'Renamed'
+        self.assertEqual(self.generate().index.name, 'Date')
+
+    def test_inconsistent_bar_warns(self):
+        with self.assertLogs(self.generator.logger, level='WARNING'):
+            self.generator.fixed_oscillating('A', 10, 9, 11, 10, 5, 6, 4, 5, 4)
+
+    def test_consistent_bars_do_not_warn(self):
+        with self.assertNoLogs(self.generator.logger, level='WARNING'):
+            self.generate()
+
+    def test_validation_skipped_by_default(self):
+        with patch.object(self.generator.datavalidator, 'ohlcv_validate') as validate:
+            self.generate()
+            validate.assert_not_called()
+            self.generate(validate=True)
+            validate.assert_called_once()
+
+if __name__ == '__main__':
+    unittest.main()
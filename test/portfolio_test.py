@@ -1,7 +1,5 @@
-import sys
-import os
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 import logging
+from _log_setup import configure_logger
 from core.portfolio import Portfolio
 import unittest
 from unittest.mock import MagicMock, patch
@@ -9,16 +7,12 @@ from collections import namedtuple
 from core.core import EventQueue
 from core.event import Event, MarketEvent, OrderEvent, SignalEvent, FillEvent
 from core.metrics import DataCollector
-from core.market_context import MarketContext
 
-# Setup logger to print to console
+# --- Logger Setup ---
 logger = logging.getLogger('logger')
-logger.setLevel(logging.DEBUG)  # Set minimum level to DEBUG
-console_handler = logging.StreamHandler()
-console_handler.setLevel(logging.DEBUG)  # Also handle DEBUG level logs
-formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-console_handler.setFormatter(formatter)
-logger.addHandler(console_handler)
+
+def setUpModule():
+    configure_logger()
 
 # Mock Position class to isolate Portfolio testing
 class MockPosition:
@@ -28,19 +22,38 @@ class MockPosition:
         self.quantity = 10
         self.avg_cost = 100
         self.realized_pnl = 0
-        self.update_position = MagicMock()
-        self.update_fill = MagicMock(return_value=True)
-        self.market_value = MagicMock(return_value=1000)
-        self.unrealized_pnl = MagicMock(return_value=50)
-        self.snapshot = MagicMock(return_value={})
+        # Plain methods with call lists, MagicMock records far more than these tests check
+        self.update_position_calls = []
+        self.update_fill_calls = []
+
+    def update_position(self, *args):
+        self.update_position_calls.append(args)
+
+    def update_fill(self, fill_event):
+        self.update_fill_calls.append(fill_event)
+        return True
+
+    def market_value(self, *args):
+        return 1000
+
+    def unrealized_pnl(self, *args):
+        return 50
+
+    def snapshot(self):
+        return {}
 
 class TestPortfolio(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Shared across tests, emptied in setUp. The portfolio itself is rebuilt per test.
+        cls.event_queue = EventQueue() # This is only valid as long as the queue is really only a queue!
+        cls.price_source = MagicMock()
+        cls.data_collector = DataCollector()
+
     def setUp(self):
-        self.event_queue = EventQueue() # This is only valid as long as the queue is really only a queue!
-        self.price_source = MagicMock()
-        self.price_source.price = MarketContext()
-        self.price_source.price = MagicMock()
-        self.data_collector = DataCollector()
+        self.event_queue.clear()
+        self.data_collector.clear()
+        self.price_source.reset_mock(return_value=True, side_effect=True)
         self.portfolio = Portfolio(initial_cash=10000, price_source=self.price_source,
                                    cash_reserve=1000,
                                     event_queue=self.event_queue,logger=logger,
@@ -139,7 +152,7 @@ class TestPortfolio(unittest.TestCase):
         self.portfolio.handle_event(fill_event)
 
         # Confirm position.update_fill called
-        self.portfolio.positions['AAPL'].update_fill.assert_called_with(fill_event)
+        self.assertEqual(self.portfolio.positions['AAPL'].update_fill_calls[-1], fill_event)
         
         # Cash deducted by commission + slippage + fillprice*quantity
         self.assertEqual(self.portfolio.cash, old_cash - 10 - 2 - 5*105)
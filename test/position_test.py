@@ -1,11 +1,10 @@
-import sys
-import os
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
 from core.position import Position
 import unittest
-from core.position import Position  # Adjust to match your actual import
-from types import SimpleNamespace
+import logging
+import random
+import numpy as np
+from fractions import Fraction
+from core.event import FillEvent, Direction
 
 class TestPosition(unittest.TestCase):
 
@@ -13,7 +12,9 @@ class TestPosition(unittest.TestCase):
         self.pos = Position(symbol='AAPL')
 
     def create_fill_event(self, direction, quantity, price, commission=0.0, slippage=0.0):
-        return SimpleNamespace(
+        return FillEvent(
+            timestamp=None,
+            symbol='AAPL',
             direction=direction,
             quantity=quantity,
             fill_price=price,
@@ -52,6 +53,16 @@ class TestPosition(unittest.TestCase):
         self.assertEqual(self.pos.avg_cost, 0.0)
         self.assertAlmostEqual(self.pos.realized_pnl, 50)  # (55 - 50) * 10
 
+    def test_fractional_quantities_keep_avg_cost(self):
+        self.pos.update_fill(self.create_fill_event('BUY', 0.1, 100.0))
+        self.pos.update_fill(self.create_fill_event('BUY', 0.2, 100.0))
+        self.pos.update_fill(self.create_fill_event('SELL', 0.3, 100.0))
+        # 0.1 + 0.2 - 0.3 leaves floating point dust in the quantity, the average must not drift
+        self.assertAlmostEqual(self.pos.avg_cost, 100.0)
+        self.pos.update_fill(self.create_fill_event('BUY', 0.7, 50.0))
+        self.pos.update_fill(self.create_fill_event('SELL', 0.35, 60.0))
+        self.assertAlmostEqual(self.pos.avg_cost, 50.0, places=6)
+
     def test_sell_more_than_held(self):
         self.pos.update_fill(self.create_fill_event('BUY', 5, 100))
         result = self.pos.update_fill(self.create_fill_event('SELL', 10, 105))
@@ -75,5 +86,145 @@ class TestPosition(unittest.TestCase):
         self.pos.update_fill(self.create_fill_event('BUY', 10, 100))
         self.assertEqual(self.pos.unrealized_pnl(105), 50)
 
+    def test_update_fills_batch(self):
+        accepted = self.pos.update_fills_batch(['BUY', 'SELL', 'SELL', 'HOLD', 'BUY'],
+                                               [10, 20, 4, 1, 0],
+                                               [100.0, 110.0, 110.0, 100.0, 100.0],
+                                               [1.0, 0.0, 1.0, 0.0, 0.0],
+                                               [0.5, 0.0, 0.5, 0.0, 0.0])
+        self.assertEqual(accepted.tolist(), [True, False, True, False, False])
+        self.assertEqual(self.pos.quantity, 6)
+        self.assertAlmostEqual(self.pos.realized_pnl, (110.0 - 100.15) * 4 - 1.0 - 0.5)
+        self.assertAlmostEqual(self.pos.cumulated_commission, 2.0)
+        self.assertAlmostEqual(self.pos.cumulated_slippage, 1.0)
+
+    def test_direction_encode(self):
+        encoded = Direction.encode(['BUY', 'SELL', 'HOLD'])
+        self.assertEqual(encoded.dtype, np.int8)
+        self.assertEqual(encoded.tolist(), [Direction.BUY, Direction.SELL, 0])
+
+    def test_update_fills_batch_encoded_directions(self):
+        directions = ['BUY', 'SELL', 'HOLD', 'SELL']
+        quantities, prices = [10, 4, 1, 20], [100.0, 110.0, 100.0, 110.0]
+        fees = [0.5, 0.5, 0.0, 0.0]
+        reference = Position(symbol='AAPL')
+        expected = reference.update_fills_batch(directions, quantities, prices, fees, fees)
+        accepted = self.pos.update_fills_batch(Direction.encode(directions), quantities, prices, fees, fees)
+        self.assertEqual(accepted.tolist(), expected.tolist())
+        self.assertEqual(self.pos.snapshot(), reference.snapshot())
+
+    def test_direction_members_accepted(self):
+        self.assertTrue(self.pos.update_fill(self.create_fill_event(Direction.BUY, 5, 100.0)))
+        accepted = self.pos.update_fills_batch([Direction.BUY, Direction.SELL], [5, 4], [100.0, 110.0],
+                                               [0.0, 0.0], [0.0, 0.0])
+        self.assertEqual(accepted.tolist(), [True, True])
+        self.assertEqual(self.pos.quantity, 6)
+
+    def test_plain_numbers_rejected_as_directions(self):
+        for direction in (1, True, 1.0):
+            self.assertFalse(self.pos.update_fill(self.create_fill_event(direction, 5, 100.0)))
+        self.assertEqual(self.pos.quantity, 0)
+        accepted = self.pos.update_fills_batch([True, 1.0, 1], [5, 5, 5], [100.0] * 3, [0.0] * 3, [0.0] * 3)
+        self.assertEqual(accepted.tolist(), [False, False, False])
+
+    def test_update_fills_batch_matches_update_fill(self):
+        fills = [('BUY', 10, 50.0, 0.5, 0.1), ('BUY', 5, 60.0, 0.2, 0.1), ('SELL', 15, 70.0, 1.0, 0.3)]
+        reference = Position(symbol='AAPL')
+        for fill in fills:
+            reference.update_fill(self.create_fill_event(*fill))
+        self.pos.update_fills_batch(*zip(*fills))
+        self.assertEqual(self.pos.snapshot(), reference.snapshot())
+
+class TestPositionRandomFills(unittest.TestCase):
+    '''
+    Randomized fill sequences (fixed seeds) checked against an exact reference in rational arithmetic.
+    Quantities are tenths, prices and fees whole cents, so the reference carries no rounding at all.
+    '''
+    SEQUENCES = 200
+    FILLS_PER_SEQUENCE = 50
+
+    @classmethod
+    def setUpClass(cls):
+        # Rejected sells are expected here, their warnings are silenced on a logger of this test only
+        cls.logger = logging.getLogger(f'{__name__}.random_fills')
+        cls.logger.disabled = True
+
+    def random_fills(self, rng):
+        fills = []
+        held = Fraction(0)
+        for _ in range(self.FILLS_PER_SEQUENCE):
+            direction = rng.choice(['BUY', 'SELL'])
+            quantity = Fraction(rng.randint(1, 10000), 10)
+            # Closing the whole position is where float dust in the quantity shows up
+            if direction == 'SELL' and held and rng.random() < 0.2:
+                quantity = held
+            if direction == 'BUY':
+                held += quantity
+            elif quantity <= held:
+                held -= quantity
+            price = rng.randint(1, 100000) / 100
+            commission = rng.randint(0, 500) / 100
+            slippage = rng.randint(0, 500) / 100
+            fills.append((direction, float(quantity), price, commission, slippage))
+        return fills
+
+    def reference(self, fills, accepted):
+        '''
+        Plain-Python oracle: returns (accepted, quantity, avg cost, realized pnl) as exact values after every fill.
+        Quantities differ by at least a tenth, except when a sell closes the whole position. Float dust may
+        reject that sell in the position, so for ties the position's decision is followed.
+        '''
+        states = []
+        quantity, cost_basis, realized_pnl = Fraction(0), Fraction(0), Fraction(0)
+        for (direction, fill_qty, price, commission, slippage), position_accepted in zip(fills, accepted):
+            fill_qty = Fraction(str(fill_qty))
+            price, fees = Fraction(str(price)), Fraction(str(commission)) + Fraction(str(slippage))
+            ok = direction == 'BUY' or fill_qty < quantity or (fill_qty == quantity and position_accepted)
+            if direction == 'BUY':
+                cost_basis += price * fill_qty + fees
+                quantity += fill_qty
+            elif ok:
+                avg_cost = cost_basis / quantity
+                realized_pnl += (price - avg_cost) * fill_qty - fees
+                quantity -= fill_qty
+                cost_basis = cost_basis - avg_cost * fill_qty if quantity else Fraction(0)
+            states.append((ok, quantity, cost_basis / quantity if quantity else Fraction(0), realized_pnl))
+        return states
+
+    def assert_state_matches(self, state, ref_state):
+        '''state: (accepted, quantity, avg cost, realized pnl) of the position after one fill'''
+        accepted, quantity, avg_cost, realized_pnl = state
+        ref_accepted, ref_quantity, ref_avg_cost, ref_realized_pnl = ref_state
+        self.assertEqual(accepted, ref_accepted)
+        self.assertAlmostEqual(quantity, float(ref_quantity), delta=1e-9 * max(1.0, ref_quantity))
+        # A fully closed position may keep float dust as quantity, its average is then meaningless
+        if ref_quantity:
+            self.assertAlmostEqual(avg_cost, float(ref_avg_cost), delta=1e-9 * max(1.0, abs(ref_avg_cost)))
+        self.assertAlmostEqual(realized_pnl, float(ref_realized_pnl), delta=1e-9 * max(1.0, abs(ref_realized_pnl)))
+
+    def test_update_fill_matches_reference(self):
+        rng = random.Random(0)
+        for _ in range(self.SEQUENCES):
+            fills = self.random_fills(rng)
+            position = Position(symbol='AAPL', logger=self.logger)
+            states = []
+            for direction, qty, price, commission, slippage in fills:
+                accepted = position.update_fill(FillEvent(None, 'AAPL', qty, direction, price, commission, slippage))
+                states.append((accepted, position.quantity, position.avg_cost, position.realized_pnl))
+            # Compared after every fill, so the average is checked after each partial sell as well
+            for state, ref_state in zip(states, self.reference(fills, [state[0] for state in states])):
+                self.assert_state_matches(state, ref_state)
+
+    def test_update_fills_batch_matches_reference(self):
+        rng = random.Random(1)
+        for _ in range(self.SEQUENCES):
+            fills = self.random_fills(rng)
+            position = Position(symbol='AAPL', logger=self.logger)
+            accepted = position.update_fills_batch(*zip(*fills)).tolist()
+            ref_states = self.reference(fills, accepted)
+            self.assertEqual(accepted, [ref_state[0] for ref_state in ref_states])
+            self.assert_state_matches((accepted[-1], position.quantity, position.avg_cost, position.realized_pnl),
+                                      ref_states[-1])
+
 if __name__ == '__main__':
     unittest.main()
